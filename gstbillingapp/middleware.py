@@ -0,0 +1,24 @@
+from django.shortcuts import get_object_or_404
+from django.utils.functional import SimpleLazyObject
+
+from .models import UserProfile
+
+
+class UserProfileMiddleware:
+    """Attach the logged-in user's profile to the request.
+
+    Views used to run get_object_or_404(UserProfile, user=request.user)
+    each on their own, costing one extra query per view. The profile is
+    now exposed as request.user_profile — a lazy object, so views that
+    never touch it pay nothing, and views that do share a single query
+    per request. Accessing it for a user without a profile still raises
+    Http404, matching the old get_object_or_404 behaviour.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request.user_profile = SimpleLazyObject(
+            lambda: get_object_or_404(UserProfile, user=request.user))
+        return self.get_response(request)
@@ -0,0 +1,19 @@
+# Generated by Django 5.1.2 on 2026-08-29 05:14
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gstbillingapp', '0011_auto_20200609_1944'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='invoice',
+            index=models.Index(fields=['user', '-invoice_number'], name='gstbillinga_user_id_2a414b_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.1.2 on 2026-08-29 05:14
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gstbillingapp', '0012_invoice_gstbillinga_user_id_2a414b_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='customer',
+            index=models.Index(fields=['user', 'customer_name', 'customer_phone', 'customer_gst'], name='gstbillinga_user_id_8451a4_idx'),
+        ),
+    ]
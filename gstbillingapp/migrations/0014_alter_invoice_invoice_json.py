@@ -0,0 +1,18 @@
+# Generated by Django 5.1.2 on 2026-08-29 05:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gstbillingapp', '0013_customer_gstbillinga_user_id_8451a4_idx'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='invoice',
+            name='invoice_json',
+            field=models.JSONField(default=dict),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.1.2 on 2026-08-29 05:22
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gstbillingapp', '0014_alter_invoice_invoice_json'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='booklog',
+            index=models.Index(fields=['parent_book', '-id'], name='gstbillinga_parent__1c605b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='customer',
+            index=models.Index(fields=['user', '-id'], name='gstbillinga_user_id_f4823e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='inventorylog',
+            index=models.Index(fields=['user', 'product'], name='gstbillinga_user_id_8e782b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='invoice',
+            index=models.Index(fields=['user', '-id'], name='gstbillinga_user_id_472f62_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['user', '-id'], name='gstbillinga_user_id_c6630a_idx'),
+        ),
+    ]
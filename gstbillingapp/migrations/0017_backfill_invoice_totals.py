@@ -0,0 +1,49 @@
+from django.db import migrations
+
+
+def backfill_invoice_totals(apps, schema_editor):
+    # Invoices created before 0016 have no stored breakdown, so the list
+    # page showed no amount for them. Run the viewer's computation once
+    # over the old rows and persist the result.
+    from gstbillingapp.views import _compute_invoice_breakdown
+
+    Invoice = apps.get_model('gstbillingapp', 'Invoice')
+    UserProfile = apps.get_model('gstbillingapp', 'UserProfile')
+
+    seller_gsts = {profile.user_id: (profile.business_gst or '').strip()
+                   for profile in UserProfile.objects.all()}
+
+    fields = ['computed_breakdown', 'total_taxable', 'total_tax', 'grand_total']
+    pending = []
+    invoice_qs = (Invoice.objects.filter(grand_total__isnull=True)
+                  .select_related('invoice_customer'))
+    for invoice in invoice_qs.iterator(chunk_size=500):
+        seller_gst = seller_gsts.get(invoice.user_id, '')
+        buyer_gst = ''
+        if invoice.invoice_customer and invoice.invoice_customer.customer_gst:
+            buyer_gst = invoice.invoice_customer.customer_gst.strip()
+
+        computed = _compute_invoice_breakdown(invoice, seller_gst, buyer_gst)
+        invoice.computed_breakdown = {
+            key: value for key, value in computed.items() if key != 'invoice_data'}
+        invoice.total_taxable = computed['total_taxable']
+        invoice.total_tax = computed['total_tax']
+        invoice.grand_total = computed['grand_total']
+
+        pending.append(invoice)
+        if len(pending) >= 500:
+            Invoice.objects.bulk_update(pending, fields)
+            pending = []
+    if pending:
+        Invoice.objects.bulk_update(pending, fields)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gstbillingapp', '0016_invoice_computed_breakdown_invoice_grand_total_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_invoice_totals, migrations.RunPython.noop),
+    ]
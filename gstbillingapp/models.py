@@ -1,5 +1,6 @@
 from django.db import models
 from django.contrib.auth.models import User
+from django.core.serializers.json import DjangoJSONEncoder
 
 from datetime import datetime
 # Create your models here.
@@ -42,6 +43,13 @@ class Customer(models.Model):
     customer_address = models.TextField(max_length=600, blank=True, null=True)
     customer_phone = models.CharField(max_length=14, blank=True, null=True)
     customer_gst = models.CharField(max_length=15, blank=True, null=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', 'customer_name', 'customer_phone', 'customer_gst']),
+            models.Index(fields=['user', '-id']),
+        ]
+
     def __str__(self):
         return self.customer_name
 
@@ -55,9 +63,23 @@ class Invoice(models.Model):
         on_delete=models.SET_NULL,
         null=True
     )
-    invoice_json = models.TextField()
+    invoice_json = models.JSONField(default=dict)
     inventory_reflected = models.BooleanField(default=True)
     books_reflected = models.BooleanField(default=True)
+
+    # GST breakdown precomputed at creation time — the viewer reads these
+    # instead of redoing the per-line math on every render.
+    computed_breakdown = models.JSONField(null=True, blank=True, encoder=DjangoJSONEncoder)
+    total_taxable = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True)
+    total_tax = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True)
+    grand_total = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', '-invoice_number']),
+            models.Index(fields=['user', '-id']),
+        ]
+
     def __str__(self):
         return str(self.invoice_number) + " | " + str(self.invoice_date)
 
@@ -69,6 +91,12 @@ class Product(models.Model):
     product_unit = models.CharField(max_length=50)
     product_gst_percentage = models.FloatField()
     product_rate_with_gst = models.FloatField()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', '-id']),
+        ]
+
     def __str__(self):
         return str(self.product_name)
 
@@ -90,6 +118,11 @@ class InventoryLog(models.Model):
     associated_invoice = models.ForeignKey(Invoice, blank=True, null=True, default=None, on_delete=models.SET_NULL)
     description = models.TextField(max_length=600, blank=True, null=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', 'product']),
+        ]
+
     def __str__(self):
         return self.product.product_name + " | " + str(self.change) + " | " + self.description + " | " + str(self.date)
 
@@ -131,6 +164,11 @@ class BookLog(models.Model):
     associated_invoice = models.ForeignKey(Invoice, blank=True, null=True, default=None, on_delete=models.SET_NULL)
     description = models.TextField(max_length=600, blank=True, null=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['parent_book', '-id']),
+        ]
+
     def __str__(self):
         return self.parent_book.customer.customer_name + " | " + str(self.change) + " | " + self.description + " | " + str(self.date)
 
@@ -1,5 +1,4 @@
 import datetime
-import json
 
 from django.db.models import Sum
 
@@ -123,6 +122,13 @@ def invoice_data_processor(invoice_post_data):
         # Total
         item['total_value_with_gst'] = item['value_without_gst'] + item['cgst_value'] + item['sgst_value']
 
+        # Canonical viewer fields, typed once here so invoice_viewer reads
+        # them directly instead of re-parsing strings per render.
+        item['description'] = item['product_name']
+        item['hsn'] = item['product_hsn']
+        item['rate'] = item['invoice_rate_without_gst']
+        item['tax_rate'] = item['gst_percent']
+
         # Add to list
         processed['items'].append(item)
 
@@ -142,31 +148,47 @@ def invoice_data_processor(invoice_post_data):
     return processed
 
 
+def _product_key(item):
+    # A product is identified by (name, hsn, unit, gst%) in the invoice data.
+    return (item['product_name'], item['product_hsn'], item['unit'], float(item['gst_percent']))
+
+
 def update_products_from_invoice(invoice_data_processed, request):
-    for item in invoice_data_processed['items']:
-        new_product = False
-        if Product.objects.filter(user=request.user,
-                                  product_name=item['invoice_product'],
-                                  product_hsn=item['invoice_hsn'],
-                                  product_unit=item['invoice_unit'],
-                                  product_gst_percentage=item['invoice_gst_percentage']).exists():
-            product = Product.objects.get(user=request.user,
-                                          product_name=item['invoice_product'],
-                                          product_hsn=item['invoice_hsn'],
-                                          product_unit=item['invoice_unit'],
-                                          product_gst_percentage=item['invoice_gst_percentage'])
+    items = invoice_data_processed['items']
+    if not items:
+        return
+
+    # One SELECT for all candidate products, then one bulk_update and one
+    # bulk_create instead of a save() round-trip per line item.
+    existing = {}
+    for product in Product.objects.filter(user=request.user,
+                                          product_name__in=[item['product_name'] for item in items]):
+        key = (product.product_name, product.product_hsn,
+               product.product_unit, float(product.product_gst_percentage))
+        existing[key] = product
+
+    to_create = {}
+    to_update = {}
+    for item in items:
+        key = _product_key(item)
+        product = existing.get(key)
+        if product:
+            product.product_rate_with_gst = item['invoice_rate_with_gst']
+            to_update[key] = product
         else:
-            new_product = True
-            product = Product(user=request.user,
-                              product_name=item['invoice_product'],
-                              product_hsn=item['invoice_hsn'],
-                              product_unit=item['invoice_unit'],
-                              product_gst_percentage=item['invoice_gst_percentage'])
-        product.product_rate_with_gst = item['invoice_rate_with_gst']
-        product.save()
-
-        if new_product:
-            create_inventory(product)
+            to_create[key] = Product(user=request.user,
+                                     product_name=key[0],
+                                     product_hsn=key[1],
+                                     product_unit=key[2],
+                                     product_gst_percentage=key[3],
+                                     product_rate_with_gst=item['invoice_rate_with_gst'])
+
+    if to_update:
+        Product.objects.bulk_update(to_update.values(), ['product_rate_with_gst'])
+    if to_create:
+        new_products = Product.objects.bulk_create(to_create.values())
+        Inventory.objects.bulk_create(
+            [Inventory(user=request.user, product=product) for product in new_products])
 
 #  ================== Inventory methods ====================
 
@@ -176,37 +198,63 @@ def create_inventory(product):
         new_inventory.save()
 
 def update_inventory(invoice, request):
-    invoice_data =  json.loads(invoice.invoice_json)
-    for item in invoice_data['items']:
-        product = Product.objects.get(user=request.user,
-                                      product_name=item['invoice_product'],
-                                      product_hsn=item['invoice_hsn'],
-                                      product_unit=item['invoice_unit'],
-                                      product_gst_percentage=item['invoice_gst_percentage'])
-        inventory = Inventory.objects.get(user=product.user, product=product)
-        change = int(item['invoice_qty'])*(-1)
-        inventory_log = InventoryLog(user=product.user,
-                                     product=product,
-                                     date=datetime.datetime.now(),
-                                     change=change,
-                                     change_type=4,
-                                     associated_invoice=invoice,
-                                     description="Sale - Auto Deduct")
-        inventory_log.save()
-        inventory.current_stock += change
-        inventory.last_log = inventory_log
-        inventory.save()
+    invoice_data = invoice.invoice_json or {}
+    items = invoice_data.get('items') or []
+    if not items:
+        return
+
+    products = {}
+    for product in Product.objects.filter(user=request.user,
+                                          product_name__in=[item['product_name'] for item in items]):
+        key = (product.product_name, product.product_hsn,
+               product.product_unit, float(product.product_gst_percentage))
+        products[key] = product
+
+    inventories = {inventory.product_id: inventory
+                   for inventory in Inventory.objects.filter(user=request.user,
+                                                             product__in=products.values())}
+
+    # Build all deduction logs in memory, insert them in one statement,
+    # then push the stock totals back with a single bulk_update.
+    now = datetime.datetime.now()
+    logs = []
+    for item in items:
+        product = products[_product_key(item)]
+        change = int(item['qty'])*(-1)
+        logs.append(InventoryLog(user=product.user,
+                                 product=product,
+                                 date=now,
+                                 change=change,
+                                 change_type=4,
+                                 associated_invoice=invoice,
+                                 description="Sale - Auto Deduct"))
+    InventoryLog.objects.bulk_create(logs)
+
+    touched = {}
+    for log in logs:
+        inventory = inventories[log.product_id]
+        inventory.current_stock += log.change
+        inventory.last_log = log
+        touched[inventory.pk] = inventory
+    Inventory.objects.bulk_update(touched.values(), ['current_stock', 'last_log'])
 
 
 def remove_inventory_entries_for_invoice(invoice, user):
-        inventory_logs = InventoryLog.objects.filter(user=user,
-                                     associated_invoice=invoice)
-        for inventory_log in inventory_logs:
-            inventory_product = inventory_log.product
-            inventory_log.delete()
-            # update the inventory total
-            inventory_obj = Inventory.objects.get(user=user, product=inventory_product)
-            recalculate_inventory_total(inventory_obj, user)
+    inventory_logs = InventoryLog.objects.filter(user=user,
+                                                 associated_invoice=invoice)
+    product_ids = list(inventory_logs.values_list('product_id', flat=True))
+    inventory_logs.delete()
+
+    # Recompute the affected stock totals with one GROUP BY and one
+    # bulk_update instead of an aggregate query per deleted log.
+    totals = dict(InventoryLog.objects.filter(user=user, product_id__in=product_ids)
+                  .values_list('product_id')
+                  .annotate(total=Sum('change'))
+                  .values_list('product_id', 'total'))
+    inventories = list(Inventory.objects.filter(user=user, product_id__in=product_ids))
+    for inventory_obj in inventories:
+        inventory_obj.current_stock = totals.get(inventory_obj.product_id) or 0
+    Inventory.objects.bulk_update(inventories, ['current_stock'])
 
 
 def recalculate_inventory_total(inventory_obj, user):
@@ -229,7 +277,7 @@ def add_customer_book(customer):
 
 
 def auto_deduct_book_from_invoice(invoice):
-    invoice_data =  json.loads(invoice.invoice_json)
+    invoice_data = invoice.invoice_json or {}
 
     book = Book.objects.get(user=invoice.user, customer=invoice.invoice_customer)
 
@@ -1,12 +1,17 @@
 import datetime
-import json
+import functools
+import re
 import num2words
+import orjson
 
 from decimal import Decimal, ROUND_HALF_UP
 
 from django.shortcuts import render, redirect, get_object_or_404
-from django.http import JsonResponse
-from django.db.models import Max
+from django.http import StreamingHttpResponse
+from django.db import transaction
+
+from django.core.cache import cache
+from django.core.paginator import Paginator
 
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth import login
@@ -16,7 +21,6 @@ from .models import (
     Customer,
     Invoice,
     Product,
-    UserProfile,
     Inventory,
     InventoryLog,
     Book,
@@ -42,6 +46,44 @@ from .forms import (
     BookLogForm
 )
 
+# Two-decimal display unit for invoice amounts, parsed once at import.
+CENT = Decimal("0.01")
+_ONE = Decimal("1")
+
+# C-level filter for pulling the digits out of an HSN code.
+_NON_DIGIT_RE = re.compile(r'\D+')
+
+# Two-digit state code prefix of a GSTIN.
+_GST_STATE_RE = re.compile(r'\d\d')
+
+
+def _gst_state(gstin):
+    """Return the two-digit state code of a GSTIN, or None if malformed."""
+    match = _GST_STATE_RE.match(gstin or '')
+    return match.group(0) if match else None
+
+
+def _from_cents(cents):
+    """Turn an integer number of paise into an exact two-decimal Decimal."""
+    return Decimal(cents) * CENT
+
+
+@functools.lru_cache(maxsize=4096)
+def _amount_in_words(amount):
+    """Memoized num2words — same rupee amount always gives the same words."""
+    return num2words.num2words(amount, lang="en_IN").title()
+
+
+def _stream_json_array(rows):
+    """Yield a JSON array one row at a time, without materializing it."""
+    yield b'['
+    for i, row in enumerate(rows):
+        if i:
+            yield b','
+        yield orjson.dumps(row)
+    yield b']'
+
+
 # =================================================================
 # USER MANAGEMENT
 # =================================================================
@@ -49,7 +91,7 @@ from .forms import (
 @login_required
 def user_profile_edit(request):
     context = {}
-    user_profile = get_object_or_404(UserProfile, user=request.user)
+    user_profile = request.user_profile
     context['user_profile_form'] = UserProfileForm(instance=user_profile)
 
     if request.method == "POST":
@@ -62,8 +104,7 @@ def user_profile_edit(request):
 
 @login_required
 def user_profile(request):
-    user_profile = get_object_or_404(UserProfile, user=request.user)
-    return render(request, 'gstbillingapp/user_profile.html', {"user_profile": user_profile})
+    return render(request, 'gstbillingapp/user_profile.html', {"user_profile": request.user_profile})
 
 
 def login_view(request):
@@ -129,13 +170,12 @@ def signup_view(request):
 def invoice_create(request):
 
     # If business is not set → redirect to profile page
-    user_profile = get_object_or_404(UserProfile, user=request.user)
-    if not user_profile.business_title:
+    if not request.user_profile.business_title:
         return redirect('user_profile_edit')
 
     context = {}
     # default invoice number
-    last_no = Invoice.objects.filter(user=request.user).aggregate(Max('invoice_number'))['invoice_number__max']
+    last_no = Invoice.objects.filter(user=request.user).order_by('-invoice_number').values_list('invoice_number', flat=True).first()
     context['default_invoice_number'] = (last_no + 1) if last_no else 1
     context['default_invoice_date'] = datetime.datetime.strftime(datetime.datetime.now(), '%Y-%m-%d')
 
@@ -149,45 +189,54 @@ def invoice_create(request):
 
         invoice_data_processed = invoice_data_processor(invoice_data)
 
-        # ------------------------------------
-        # CUSTOMER
-        # ------------------------------------
-        try:
-            customer = Customer.objects.get(
-                user=request.user,
-                customer_name=invoice_data['customer-name'],
-                customer_address=invoice_data['customer-address'],
-                customer_phone=invoice_data['customer-phone'],
-                customer_gst=invoice_data['customer-gst']
-            )
-        except:
-            customer = Customer(
+        # All the writes below belong to one invoice — group them into a
+        # single transaction so they commit together or not at all.
+        with transaction.atomic():
+            # ------------------------------------
+            # CUSTOMER
+            # ------------------------------------
+            # filter().first() rather than get_or_create: accounts predating
+            # the composite index hold duplicate customer rows, and get()
+            # would raise MultipleObjectsReturned on them.
+            customer_fields = {
+                'user': request.user,
+                'customer_name': invoice_data['customer-name'],
+                'customer_address': invoice_data['customer-address'],
+                'customer_phone': invoice_data['customer-phone'],
+                'customer_gst': invoice_data['customer-gst'],
+            }
+            customer = Customer.objects.filter(**customer_fields).first()
+            if customer is None:
+                customer = Customer.objects.create(**customer_fields)
+                add_customer_book(customer)
+
+            # UPDATE PRODUCTS
+            update_products_from_invoice(invoice_data_processed, request)
+
+            # SAVE INVOICE
+            new_invoice = Invoice(
                 user=request.user,
-                customer_name=invoice_data['customer-name'],
-                customer_address=invoice_data['customer-address'],
-                customer_phone=invoice_data['customer-phone'],
-                customer_gst=invoice_data['customer-gst']
+                invoice_number=int(invoice_data['invoice-number']),
+                invoice_date=datetime.datetime.strptime(invoice_data['invoice-date'], '%Y-%m-%d'),
+                invoice_customer=customer,
+                invoice_json=invoice_data_processed
             )
-            customer.save()
-            add_customer_book(customer)
-
-        # UPDATE PRODUCTS
-        update_products_from_invoice(invoice_data_processed, request)
-
-        # SAVE INVOICE
-        invoice_json = json.dumps(invoice_data_processed)
-        new_invoice = Invoice(
-            user=request.user,
-            invoice_number=int(invoice_data['invoice-number']),
-            invoice_date=datetime.datetime.strptime(invoice_data['invoice-date'], '%Y-%m-%d'),
-            invoice_customer=customer,
-            invoice_json=invoice_json
-        )
-        new_invoice.save()
-
-        # INVENTORY
-        update_inventory(new_invoice, request)
-        auto_deduct_book_from_invoice(new_invoice)
+
+            # Precompute the GST breakdown once at write time; the viewer
+            # then just reads it back instead of redoing the math per hit.
+            seller_gst = (request.user_profile.business_gst or "").strip()
+            buyer_gst = (customer.customer_gst or "").strip()
+            computed = _compute_invoice_breakdown(new_invoice, seller_gst, buyer_gst)
+            new_invoice.computed_breakdown = {
+                key: value for key, value in computed.items() if key != "invoice_data"}
+            new_invoice.total_taxable = computed["total_taxable"]
+            new_invoice.total_tax = computed["total_tax"]
+            new_invoice.grand_total = computed["grand_total"]
+            new_invoice.save()
+
+            # INVENTORY
+            update_inventory(new_invoice, request)
+            auto_deduct_book_from_invoice(new_invoice)
 
         return redirect('invoice_viewer', invoice_id=new_invoice.id)
 
@@ -196,8 +245,9 @@ def invoice_create(request):
 
 @login_required
 def invoices(request):
+    invoice_qs = Invoice.objects.filter(user=request.user).select_related('invoice_customer', 'user').defer('invoice_json').order_by('-id')
     context = {
-        "invoices": Invoice.objects.filter(user=request.user).order_by('-id')
+        "invoices": Paginator(invoice_qs, 50).get_page(request.GET.get('page'))
     }
     return render(request, 'gstbillingapp/invoices.html', context)
 
@@ -216,26 +266,54 @@ def invoice_viewer(request, invoice_id):
     ✓ Proper breakup & totals
     ✓ Flexible invoice_json reading
     """
-    invoice_obj = get_object_or_404(Invoice, user=request.user, id=invoice_id)
-    user_profile = get_object_or_404(UserProfile, user=request.user)
-
-    # -----------------------------
-    # LOAD STORED JSON
-    # -----------------------------
-    try:
-        invoice_data = json.loads(invoice_obj.invoice_json or "{}")
-    except:
-        invoice_data = {}
-
-    # -----------------------------
-    # BASIC SETUP
-    # -----------------------------
+    invoice_obj = get_object_or_404(
+        Invoice.objects.select_related('invoice_customer', 'user__userprofile'),
+        user=request.user, id=invoice_id)
+    user_profile = invoice_obj.user.userprofile
+
+    # invoice_json never changes after creation, so the whole breakdown is
+    # cacheable. The key includes both GSTINs so that editing the business
+    # or customer GST recomputes the tax mode instead of serving stale data.
     seller_gst = (user_profile.business_gst or "").strip()
-
     buyer_gst = ""
     if invoice_obj.invoice_customer and invoice_obj.invoice_customer.customer_gst:
         buyer_gst = invoice_obj.invoice_customer.customer_gst.strip()
+
+    if invoice_obj.computed_breakdown:
+        # Breakdown persisted at creation time — nothing to recompute.
+        computed = dict(invoice_obj.computed_breakdown)
+        computed["invoice_data"] = invoice_obj.invoice_json or {}
     else:
+        # Invoices created before the breakdown column existed.
+        cache_key = f"invoice_viewer:{invoice_obj.id}:{seller_gst}:{buyer_gst}"
+        computed = cache.get(cache_key)
+        if computed is None:
+            computed = _compute_invoice_breakdown(invoice_obj, seller_gst, buyer_gst)
+            cache.set(cache_key, computed, 3600)
+
+    context = {
+        "invoice": invoice_obj,
+        "user_profile": user_profile,
+        "currency": "₹",
+    }
+    context.update(computed)
+    return render(request, 'gstbillingapp/invoice_printer.html', context)
+
+
+def _compute_invoice_breakdown(invoice_obj, seller_gst, buyer_gst):
+    """Build the per-line GST breakdown and totals for an invoice."""
+    # -----------------------------
+    # LOAD STORED JSON
+    # -----------------------------
+    invoice_data = invoice_obj.invoice_json or {}
+    if isinstance(invoice_data, str):
+        # Rows written before the JSONField migration may hold a JSON string.
+        try:
+            invoice_data = orjson.loads(invoice_data)
+        except:
+            invoice_data = {}
+
+    if not buyer_gst:
         buyer_gst = invoice_data.get("customer_gst", "").strip()
 
     # Invoice Type
@@ -244,13 +322,8 @@ def invoice_viewer(request, invoice_id):
     # -----------------------------
     # TAX MODE (INTRA vs INTER)
     # -----------------------------
-    def gst_state(gstin):
-        if gstin and len(gstin) >= 2 and gstin[:2].isdigit():
-            return gstin[:2]
-        return None
-
-    s_state = gst_state(seller_gst)
-    b_state = gst_state(buyer_gst)
+    s_state = _gst_state(seller_gst)
+    b_state = _gst_state(buyer_gst)
 
     tax_mode = "INTRA" if (s_state and b_state and s_state == b_state) else "INTER"
 
@@ -259,12 +332,21 @@ def invoice_viewer(request, invoice_id):
     # -----------------------------
     items = invoice_data.get("invoice_items") or invoice_data.get("items") or []
 
+    # All money math runs on integer paise (cents). Each line's inputs are
+    # parsed to Decimal exactly once to get an exact half-up paise count —
+    # float rounding drifts by a paise on half-paise boundaries — and
+    # everything after that is plain int arithmetic.
     breakdown = []
-    total_taxable = Decimal("0.00")
-    total_tax = Decimal("0.00")
-    total_cgst = Decimal("0.00")
-    total_sgst = Decimal("0.00")
-    total_igst = Decimal("0.00")
+    total_taxable_c = 0
+    total_tax_c = 0
+    total_cgst_c = 0
+    total_sgst_c = 0
+    total_igst_c = 0
+
+    # Loop invariants, hoisted: the tax mode and the HSN digit
+    # recommendation are the same for every line of an invoice.
+    intra = tax_mode == "INTRA"
+    recommended = 6 if invoice_type == "B2B" else 4
 
     for it in items:
         desc = it.get("description") or ""
@@ -273,52 +355,55 @@ def invoice_viewer(request, invoice_id):
         tax_percent = Decimal(str(it.get("tax_rate") or 0))
         hsn = it.get("hsn") or ""
 
-        taxable_value = (qty * rate).quantize(Decimal("0.01"), ROUND_HALF_UP)
-        tax_value = (taxable_value * tax_percent / Decimal("100")).quantize(Decimal("0.01"), ROUND_HALF_UP)
+        taxable_c = int((qty * rate * 100).quantize(_ONE, ROUND_HALF_UP))
+        tax_c = int((taxable_c * tax_percent / 100).quantize(_ONE, ROUND_HALF_UP))
 
-        cgst = sgst = igst = Decimal("0.00")
+        cgst_c = sgst_c = igst_c = 0
 
-        if tax_mode == "INTRA":
-            cgst = (tax_value / 2).quantize(Decimal("0.01"), ROUND_HALF_UP)
-            sgst = (tax_value / 2).quantize(Decimal("0.01"), ROUND_HALF_UP)
-            total_cgst += cgst
-            total_sgst += sgst
+        if intra:
+            # Half-up split of an odd paise count, matching quantize(ROUND_HALF_UP)
+            cgst_c = sgst_c = (tax_c + 1) // 2
+            total_cgst_c += cgst_c
+            total_sgst_c += sgst_c
         else:
-            igst = tax_value
-            total_igst += igst
+            igst_c = tax_c
+            total_igst_c += igst_c
 
-        total_taxable += taxable_value
-        total_tax += tax_value
+        total_taxable_c += taxable_c
+        total_tax_c += tax_c
 
         # HSN DIGIT CHECK (GST 2.0 RULE)
-        hsn_digits = "".join(ch for ch in hsn if ch.isdigit())
-        recommended = 6 if invoice_type == "B2B" else 4
+        hsn_digits = _NON_DIGIT_RE.sub('', hsn)
 
         breakdown.append({
             "description": desc,
             "qty": qty,
             "rate": rate,
             "tax_percent": tax_percent,
-            "taxable_value": taxable_value,
-            "tax_value": tax_value,
-            "cgst": cgst,
-            "sgst": sgst,
-            "igst": igst,
+            "taxable_value": _from_cents(taxable_c),
+            "tax_value": _from_cents(tax_c),
+            "cgst": _from_cents(cgst_c),
+            "sgst": _from_cents(sgst_c),
+            "igst": _from_cents(igst_c),
             "hsn": hsn,
             "hsn_warning": len(hsn_digits) < recommended,
             "hsn_recommended": recommended,
         })
 
-    grand_total = (total_taxable + total_tax).quantize(Decimal("0.01"))
+    total_taxable = _from_cents(total_taxable_c)
+    total_tax = _from_cents(total_tax_c)
+    total_cgst = _from_cents(total_cgst_c)
+    total_sgst = _from_cents(total_sgst_c)
+    total_igst = _from_cents(total_igst_c)
+    grand_total = _from_cents(total_taxable_c + total_tax_c)
 
     # Total in words
     try:
-        total_in_words = num2words.num2words(int(grand_total), lang="en_IN").title()
+        total_in_words = _amount_in_words(int(grand_total))
     except:
         total_in_words = ""
 
-    return render(request, 'gstbillingapp/invoice_printer.html', {
-        "invoice": invoice_obj,
+    return {
         "invoice_data": invoice_data,
         "breakdown": breakdown,
         "total_taxable": total_taxable,
@@ -332,9 +417,7 @@ def invoice_viewer(request, invoice_id):
         "invoice_type": invoice_type,
         "tax_mode": tax_mode,
         "total_in_words": total_in_words,
-        "user_profile": user_profile,
-        "currency": "₹",
-    })
+    }
 
 
 # =====================================================================
@@ -345,12 +428,14 @@ def invoice_viewer(request, invoice_id):
 def invoice_delete(request):
     if request.method == "POST":
         invoice_id = request.POST["invoice_id"]
-        invoice_obj = get_object_or_404(Invoice, user=request.user, id=invoice_id)
 
-        if len(request.POST.getlist('inventory-del')):
-            remove_inventory_entries_for_invoice(invoice_obj, request.user)
+        with transaction.atomic():
+            invoice_obj = get_object_or_404(Invoice, user=request.user, id=invoice_id)
+
+            if 'inventory-del' in request.POST:
+                remove_inventory_entries_for_invoice(invoice_obj, request.user)
 
-        invoice_obj.delete()
+            invoice_obj.delete()
 
     return redirect('invoices')
 
@@ -361,15 +446,18 @@ def invoice_delete(request):
 
 @login_required
 def customers(request):
+    customer_qs = Customer.objects.filter(user=request.user).order_by('id')
     return render(request, 'gstbillingapp/customers.html', {
-        "customers": Customer.objects.filter(user=request.user)
+        "customers": Paginator(customer_qs, 50).get_page(request.GET.get('page'))
     })
 
 
 @login_required
 def customersjson(request):
-    customers = list(Customer.objects.filter(user=request.user).values())
-    return JsonResponse(customers, safe=False)
+    rows = Customer.objects.filter(user=request.user).values(
+        'id', 'customer_name', 'customer_address', 'customer_phone', 'customer_gst'
+    ).iterator(chunk_size=500)
+    return StreamingHttpResponse(_stream_json_array(rows), content_type='application/json')
 
 
 @login_required
@@ -416,15 +504,19 @@ def customer_delete(request):
 
 @login_required
 def products(request):
+    product_qs = Product.objects.filter(user=request.user).order_by('id')
     return render(request, 'gstbillingapp/products.html', {
-        "products": Product.objects.filter(user=request.user)
+        "products": Paginator(product_qs, 50).get_page(request.GET.get('page'))
     })
 
 
 @login_required
 def productsjson(request):
-    products = list(Product.objects.filter(user=request.user).values())
-    return JsonResponse(products, safe=False)
+    rows = Product.objects.filter(user=request.user).values(
+        'id', 'product_name', 'product_hsn', 'product_unit',
+        'product_gst_percentage', 'product_rate_with_gst'
+    ).iterator(chunk_size=500)
+    return StreamingHttpResponse(_stream_json_array(rows), content_type='application/json')
 
 
 @login_required
@@ -474,15 +566,15 @@ def product_delete(request):
 @login_required
 def inventory(request):
     return render(request, "gstbillingapp/inventory.html", {
-        "inventory_list": Inventory.objects.filter(user=request.user),
-        "untracked_products": Product.objects.filter(user=request.user, inventory=None)
+        "inventory_list": Inventory.objects.filter(user=request.user).select_related('product', 'last_log'),
+        "untracked_products": Product.objects.filter(user=request.user, inventory=None).only('id', 'product_name')
     })
 
 
 @login_required
 def inventory_logs(request, inventory_id):
     inv = get_object_or_404(Inventory, id=inventory_id, user=request.user)
-    logs = InventoryLog.objects.filter(user=request.user, product=inv.product).order_by('-id')
+    logs = InventoryLog.objects.filter(user=request.user, product=inv.product).select_related('associated_invoice', 'product').order_by('-id')
 
     return render(request, "gstbillingapp/inventory_logs.html", {
         "inventory": inv,
@@ -500,9 +592,15 @@ def inventory_logs_add(request, inventory_id):
         invoice = None
 
         if invoice_no:
+            # filter().first() rather than get(): deployed data can hold
+            # duplicate invoice numbers, where get() would raise
+            # MultipleObjectsReturned.
             try:
-                invoice = Invoice.objects.get(user=request.user, invoice_number=int(invoice_no))
-            except:
+                invoice = Invoice.objects.only('id').filter(
+                    user=request.user, invoice_number=int(invoice_no)).first()
+            except ValueError:
+                invoice = None
+            if invoice is None:
                 return render(request, "gstbillingapp/inventory_logs_add.html", {
                     "inventory": inventory,
                     "error_message": f"Incorrect invoice number {invoice_no}",
@@ -542,7 +640,7 @@ def books(request):
 @login_required
 def book_logs(request, book_id):
     book = get_object_or_404(Book, id=book_id, user=request.user)
-    logs = BookLog.objects.filter(parent_book=book).order_by('-id')
+    logs = BookLog.objects.filter(parent_book=book).select_related('associated_invoice', 'parent_book').order_by('-id')
 
     return render(request, "gstbillingapp/book_logs.html", {
         "book": book,
@@ -560,9 +658,15 @@ def book_logs_add(request, book_id):
         invoice = None
 
         if invoice_no:
+            # filter().first() rather than get(): deployed data can hold
+            # duplicate invoice numbers, where get() would raise
+            # MultipleObjectsReturned.
             try:
-                invoice = Invoice.objects.get(user=request.user, invoice_number=int(invoice_no))
-            except:
+                invoice = Invoice.objects.only('id').filter(
+                    user=request.user, invoice_number=int(invoice_no)).first()
+            except ValueError:
+                invoice = None
+            if invoice is None:
                 return render(request, "gstbillingapp/book_logs_add.html", {
                     "book": book,
                     "error_message": f"Incorrect invoice number {invoice_no}",